@@ -5,7 +5,7 @@ from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.models.auth import Token, LoginRequest, User, UserCreate
-from app.services.auth_service import AuthService
+from app.services.auth_service import AuthService, fake_users_db
 from app.api.dependencies import get_current_active_user, require_admin
 from app.config.settings import settings
 
@@ -16,7 +16,7 @@ router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
 
 @router.post("/login", response_model=Token)
 async def login(login_request: LoginRequest):
-    user = AuthService.authenticate_user(
+    user = await AuthService.authenticate_user(
         login_request.username,
         login_request.password
     )
@@ -36,7 +36,7 @@ async def login(login_request: LoginRequest):
         expires_delta=access_token_expires
     )
     
-    logger.info(f"User '{user.username}' logged in successfully")
+    logger.info("User '%s' logged in successfully", user.username)
     
     return Token(
         access_token=access_token,
@@ -51,7 +51,7 @@ async def register_user(
     current_user: User = Depends(require_admin)
 ):
     try:
-        user = AuthService.create_user(
+        user = await AuthService.create_user(
             username=user_create.username,
             email=user_create.email,
             password=user_create.password,
@@ -60,11 +60,12 @@ async def register_user(
         )
         
         logger.info(
-            f"Admin '{current_user.username}' created new user: "
-            f"{user.username}"
+            "Admin '%s' created new user: %s",
+            current_user.username,
+            user.username
         )
         
-        return User(**user.model_dump())
+        return user
         
     except ValueError as e:
         raise HTTPException(
@@ -80,7 +81,5 @@ async def read_users_me(current_user: User = Depends(get_current_active_user)):
 
 @router.get("/users", response_model=list[User])
 async def list_users(current_user: User = Depends(require_admin)):
-    from app.services.auth_service import fake_users_db
-    
-    users = [User(**user.model_dump()) for user in fake_users_db.values()]
-    return users
+    # response_model=User drops hashed_password during serialization
+    return list(fake_users_db.values())
@@ -8,7 +8,7 @@ from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import logging
 
-from app.models.auth import User, TokenData, UserRole
+from app.models.auth import User, UserInDB, TokenData, UserRole
 from app.services.auth_service import AuthService
 
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ security = HTTPBearer()
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
+) -> UserInDB:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -41,7 +41,8 @@ def get_current_user(
             detail="User account is disabled"
         )
     
-    return User(**user_db.model_dump())
+    # Route response models filter out hashed_password, so no copy is needed
+    return user_db
 
 
 def get_current_active_user(
@@ -55,11 +56,16 @@ def get_current_active_user(
     return current_user
 
 
+# Shared so every RoleChecker resolves the same cached dependency chain,
+# and the bearer scheme is parsed once per request.
+_base_user_dep = Depends(get_current_active_user)
+
+
 class RoleChecker:
     def __init__(self, required_role: UserRole):
         self.required_role = required_role
     
-    def __call__(self, current_user: User = Depends(get_current_active_user)) -> User:
+    def __call__(self, current_user: User = _base_user_dep) -> User:
         if not AuthService.has_permission(current_user, self.required_role):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,94 @@
+"""ASGI middleware for the Flow Manager API.
+
+These are implemented as plain ASGI callables rather than Starlette
+``BaseHTTPMiddleware`` subclasses so they can operate on raw header
+lists without building ``Request``/``MutableHeaders`` objects.
+"""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_ALLOW_ORIGIN_ANY = (b"access-control-allow-origin", b"*")
+_PREFLIGHT_HEADERS = [
+    _ALLOW_ORIGIN_ANY,
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"vary", b"Origin"),
+    (b"content-length", b"0"),
+]
+
+
+class WildcardCORSMiddleware:
+    """CORS handling for deployments that allow every origin.
+
+    Cross-origin responses get a precomputed ``Access-Control-Allow-Origin: *``
+    header and preflight requests are answered directly, without the origin
+    matching done by Starlette's ``CORSMiddleware``. Credentials are not
+    allowed, as browsers reject them alongside a wildcard origin.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        has_origin = False
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                has_origin = True
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+        
+        if not has_origin:
+            await self.app(scope, receive, send)
+            return
+        
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = list(_PREFLIGHT_HEADERS)
+            if request_headers is not None:
+                # "*" does not cover Authorization, so echo what was asked for
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        async def send_with_origin(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [_ALLOW_ORIGIN_ANY]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_origin)
+
+
+_SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+]
+
+
+class SecurityHeadersMiddleware:
+    """Append a fixed set of security headers to every HTTP response."""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + _SECURITY_HEADERS
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
@@ -5,20 +5,28 @@ This module defines all REST API endpoints for the Flow Manager microservice.
 
 import logging
 from typing import List
-from fastapi import APIRouter, HTTPException, status, Depends
+
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
 
 from app.models.flow import Flow
 from app.models.execution import ExecutionResult, FlowExecutionState
-from app.models.auth import User, UserRole
+from app.models.auth import User
 from app.services.flow_manager import FlowManager
-from app.api.dependencies import RoleChecker
+from app.api.dependencies import require_user, require_viewer
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["flows"])
 flow_manager = FlowManager()
-require_user = RoleChecker(UserRole.USER)
-require_viewer = RoleChecker(UserRole.VIEWER)
+
+# Static health payload, serialized once for high-frequency probes
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "service": "Flow Manager",
+    "version": "1.0.0"
+})
+_HEALTH_HEADERS = {"Cache-Control": "public, max-age=5"}
 
 
 @router.post("/flows/execute", response_model=ExecutionResult, status_code=status.HTTP_200_OK)
@@ -37,21 +45,26 @@ async def execute_flow(
         flow = Flow(**flow_data)
         
         logger.info(
-            f"User '{current_user.username}' executing flow: {flow.id}"
+            "User '%s' executing flow: %s", current_user.username, flow.id
         )
         
         result = await flow_manager.execute_flow(flow)
         
-        return result
+        # Serialize with the model's prebuilt pydantic-core serializer rather
+        # than letting FastAPI dump and re-validate it against response_model
+        return Response(
+            content=result.model_dump_json(),
+            media_type="application/json"
+        )
         
     except ValueError as e:
-        logger.error(f"Flow validation error: {e}")
+        logger.error("Flow validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid flow definition: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Flow execution error: {e}", exc_info=True)
+        logger.error("Flow execution error: %s", e, exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Flow execution failed: {str(e)}"
@@ -63,7 +76,7 @@ async def get_execution_state(
     execution_id: str,
     current_user: User = Depends(require_viewer)
 ):
-    execution_state = flow_manager.get_execution_state(execution_id)
+    execution_state = await flow_manager.get_execution_state(execution_id)
     
     if not execution_state:
         raise HTTPException(
@@ -75,14 +88,18 @@ async def get_execution_state(
 
 
 @router.get("/flows/executions", response_model=List[FlowExecutionState])
-async def list_executions(current_user: User = Depends(require_viewer)):
-    return flow_manager.list_executions()
+async def list_executions(
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(require_viewer)
+):
+    return flow_manager.list_executions(limit=limit, offset=offset)
 
 
 @router.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "service": "Flow Manager",
-        "version": "1.0.0"
-    }
+    return Response(
+        content=_HEALTH_BODY,
+        media_type="application/json",
+        headers=_HEALTH_HEADERS
+    )
@@ -33,12 +33,22 @@ class Settings(BaseSettings):
     
     # Flow execution settings
     max_execution_history: int = 1000
+    execution_archive_dir: Optional[str] = None  # spill evicted executions here
     task_timeout: int = 300  # seconds
+    task_result_cache_size: int = 1024
+    
+    # Sample task simulation
+    simulate_io: bool = True
+    simulate_validation_failures: bool = True
     
     # Security settings
     secret_key: str = "your-secret-key-here-change-in-production-min-32-chars"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
+    bcrypt_rounds: int = 12  # lower (e.g. 4) for local development only
+    token_cache_ttl: int = 60  # seconds
+    token_cache_maxsize: int = 10000
+    max_token_length: int = 4096
     
     # API Key settings
     api_key_header_name: str = "X-API-Key"
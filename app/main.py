@@ -8,7 +8,8 @@ routes, and configures middleware including security features.
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -19,6 +20,8 @@ from app.config.settings import settings
 from app.utils.logger import setup_logging
 from app.api.routes import router
 from app.api.auth_routes import router as auth_router
+from app.services.task_registry import TaskRegistry
+from app.api.middleware import SecurityHeadersMiddleware, WildcardCORSMiddleware
 from app.tasks import sample_tasks  # Import to register tasks
 
 # Setup logging
@@ -38,9 +41,7 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info("Security features enabled: Authentication, Rate Limiting, CORS")
-    logger.info("Registered tasks: " + ", ".join(
-        ["task1", "task2", "task3", "validate_data", "send_notification"]
-    ))
+    logger.info("Registered tasks: " + ", ".join(TaskRegistry.list_tasks()))
     logger.info("Default users: admin/admin123, user/user123, viewer/viewer123")
     yield
     # Shutdown
@@ -53,7 +54,8 @@ app = FastAPI(
     version=settings.app_version,
     description="""
     Flow Manager Microservice - A sophisticated flow execution engine
-    that manages sequential task execution with conditional branching.
+    that schedules tasks through conditional branches, running independent
+    branches concurrently.
     
     ## Features
     
@@ -86,7 +88,8 @@ app = FastAPI(
     1. Authenticate to get a token or use an API key
     2. Define a flow with tasks and conditions
     3. Submit the flow via the `/api/v1/flows/execute` endpoint
-    4. Tasks are executed sequentially
+    4. Each task starts once a condition routes to it; branches fanned out
+       from the same task run concurrently
     5. Conditions evaluate task results and determine the next step
     6. Flow continues until completion or failure
     """,
@@ -100,30 +103,23 @@ if settings.rate_limit_enabled and limiter:
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS. Allow-all origins only need a static header, so they skip
+# Starlette's origin matching (and credentials, which browsers reject with "*").
+if settings.cors_origins == ["*"]:
+    app.add_middleware(WildcardCORSMiddleware)
+else:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
 
 # Security headers middleware
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    """Add security headers to all responses."""
-    response = await call_next(request)
-    
-    if settings.enable_security_headers:
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-        response.headers["Content-Security-Policy"] = "default-src 'self'"
-    
-    return response
+if settings.enable_security_headers:
+    app.add_middleware(SecurityHeadersMiddleware)
 
 
 # Include API routes
@@ -144,26 +140,35 @@ async def global_exception_handler(request, exc):
     )
 
 
+# Root payload only depends on settings, so it is serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "service": settings.app_name,
+    "version": settings.app_version,
+    "status": "running",
+    "docs": "/docs",
+    "api_prefix": "/api/v1",
+    "authentication": {
+        "methods": ["JWT Bearer Token", "API Key"],
+        "login_endpoint": "/api/v1/auth/login",
+        "api_key_header": "X-API-Key"
+    },
+    "security_features": {
+        "authentication": "enabled",
+        "rate_limiting": settings.rate_limit_enabled,
+        "security_headers": settings.enable_security_headers
+    }
+})
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=5"}
+
+
 @app.get("/", tags=["root"])
 async def root():
     """Root endpoint - API information."""
-    return {
-        "service": settings.app_name,
-        "version": settings.app_version,
-        "status": "running",
-        "docs": "/docs",
-        "api_prefix": "/api/v1",
-        "authentication": {
-            "methods": ["JWT Bearer Token", "API Key"],
-            "login_endpoint": "/api/v1/auth/login",
-            "api_key_header": "X-API-Key"
-        },
-        "security_features": {
-            "authentication": "enabled",
-            "rate_limiting": settings.rate_limit_enabled,
-            "security_headers": settings.enable_security_headers
-        }
-    }
+    return Response(
+        content=_ROOT_BODY,
+        media_type="application/json",
+        headers=_ROOT_HEADERS
+    )
 
 
 if __name__ == "__main__":
@@ -1,8 +1,8 @@
 """Authentication and security models."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from enum import Enum
 
 
@@ -12,6 +12,15 @@ class UserRole(str, Enum):
     VIEWER = "viewer"
 
 
+# Privilege level per role, attached to the members so permission checks
+# reduce to an integer comparison.
+_ROLE_LEVELS = {"viewer": 1, "user": 2, "admin": 3}
+
+for _role in UserRole:
+    _role.level = _ROLE_LEVELS[_role.value]
+del _role
+
+
 class User(BaseModel):
     username: str = Field(..., description="Unique username")
     email: EmailStr = Field(..., description="User email")
@@ -23,23 +32,29 @@ class User(BaseModel):
 class UserInDB(User):
     hashed_password: str = Field(..., description="Hashed password")
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=lambda: datetime.now(timezone.utc),
         description="Account creation time"
     )
 
 
 class Token(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     access_token: str = Field(..., description="JWT access token")
     token_type: str = Field(default="bearer", description="Token type")
     expires_in: int = Field(..., description="Token expiration in seconds")
 
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     username: Optional[str] = None
     role: Optional[UserRole] = None
 
 
 class LoginRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True)
+    
     username: str = Field(..., description="Username or email")
     password: str = Field(..., description="Password")
 
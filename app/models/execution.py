@@ -1,6 +1,6 @@
 """Execution result models for tracking flow execution state."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
@@ -18,7 +18,7 @@ class TaskResult(BaseModel):
     status: ExecutionStatus = Field(..., description="Execution status")
     data: Optional[Dict[str, Any]] = Field(default=None, description="Task output data")
     error: Optional[str] = Field(default=None, description="Error message if failed")
-    started_at: datetime = Field(default_factory=datetime.utcnow, description="Task start timestamp")
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Task start timestamp")
     completed_at: Optional[datetime] = Field(default=None, description="Task completion timestamp")
     
     def is_successful(self) -> bool:
@@ -32,12 +32,16 @@ class FlowExecutionState(BaseModel):
     status: ExecutionStatus = Field(..., description="Current status")
     current_task: Optional[str] = Field(default=None, description="Currently executing task")
     task_results: List[TaskResult] = Field(default_factory=list, description="Results of executed tasks")
-    started_at: datetime = Field(default_factory=datetime.utcnow, description="Execution start time")
+    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), description="Execution start time")
     completed_at: Optional[datetime] = Field(default=None, description="Execution completion time")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+    # Internal bookkeeping only; kept out of API responses and the archive
+    first_failed_task: Optional[str] = Field(default=None, exclude=True, description="First task that failed, if any")
     
     def add_task_result(self, result: TaskResult):
         self.task_results.append(result)
+        if self.first_failed_task is None and result.status == ExecutionStatus.FAILURE:
+            self.first_failed_task = result.task_name
     
     def get_last_task_result(self) -> Optional[TaskResult]:
         return self.task_results[-1] if self.task_results else None
@@ -1,15 +1,26 @@
 """Flow definition models using Pydantic for validation."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Dict, FrozenSet, Iterable, List, Optional
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 
 
 class Task(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Unique task identifier")
     description: str = Field(..., description="Task description")
 
 
 class Condition(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Unique condition identifier")
     description: str = Field(..., description="Condition description")
     source_task: str = Field(..., description="Task to evaluate")
@@ -17,7 +28,8 @@ class Condition(BaseModel):
     target_task_success: str = Field(..., description="Next task if condition is met")
     target_task_failure: str = Field(..., description="Next task if condition fails")
     
-    @validator('outcome')
+    @field_validator('outcome')
+    @classmethod
     def validate_outcome(cls, v):
         if v not in ['success', 'failure']:
             raise ValueError("Outcome must be 'success' or 'failure'")
@@ -25,34 +37,88 @@ class Condition(BaseModel):
 
 
 class Flow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
     id: str = Field(..., description="Unique flow identifier")
     name: str = Field(..., description="Flow name")
     start_task: str = Field(..., description="Initial task to execute")
     tasks: List[Task] = Field(..., description="List of tasks")
     conditions: List[Condition] = Field(..., description="List of conditions")
     
-    @validator('tasks')
+    _task_index: Dict[str, Task] = PrivateAttr(default_factory=dict)
+    _condition_index: Dict[str, List[Condition]] = PrivateAttr(default_factory=dict)
+    _reachable: Dict[str, FrozenSet[str]] = PrivateAttr(default_factory=dict)
+    
+    @field_validator('tasks')
+    @classmethod
     def validate_tasks_not_empty(cls, v):
         if not v:
             raise ValueError("Flow must have at least one task")
         return v
     
-    @validator('start_task')
-    def validate_start_task_exists(cls, v, values):
-        if 'tasks' in values:
-            task_names = [task.name for task in values['tasks']]
-            if v not in task_names:
-                raise ValueError(f"start_task '{v}' not found in tasks list")
-        return v
+    @model_validator(mode='after')
+    def build_indexes(self):
+        # Built in reverse so the first task definition wins on duplicate names
+        self._task_index = {task.name: task for task in reversed(self.tasks)}
+        self._condition_index = {}
+        for condition in self.conditions:
+            self._condition_index.setdefault(condition.source_task, []).append(
+                condition
+            )
+        
+        # Every task a condition chain starting at each source task could
+        # route to, whichever way its conditions evaluate
+        successors: Dict[str, set] = {}
+        for condition in self.conditions:
+            successors.setdefault(condition.source_task, set()).update(
+                (condition.target_task_success, condition.target_task_failure)
+            )
+        self._reachable = {}
+        for source_task, targets in successors.items():
+            seen = set()
+            stack = list(targets)
+            while stack:
+                task_name = stack.pop()
+                if task_name not in seen:
+                    seen.add(task_name)
+                    stack.extend(successors.get(task_name, ()))
+            self._reachable[source_task] = frozenset(seen)
+        
+        # start_task is declared before tasks, so it is checked here once
+        # the task index exists rather than in a field validator
+        if self.start_task not in self._task_index:
+            raise ValueError(
+                f"start_task '{self.start_task}' not found in tasks list"
+            )
+        return self
     
     def get_task(self, task_name: str) -> Optional[Task]:
-        for task in self.tasks:
-            if task.name == task_name:
-                return task
-        return None
+        return self._task_index.get(task_name)
     
     def get_condition_for_task(self, task_name: str) -> Optional[Condition]:
-        for condition in self.conditions:
-            if condition.source_task == task_name:
-                return condition
-        return None
+        conditions = self._condition_index.get(task_name)
+        return conditions[0] if conditions else None
+    
+    def get_conditions_for_task(self, task_name: str) -> List[Condition]:
+        return self._condition_index.get(task_name, [])
+    
+    def get_ready_tasks(
+        self,
+        waiting: Iterable[str],
+        running: Iterable[str]
+    ) -> List[str]:
+        """Return the waiting tasks no other waiting or running task can reach.
+        
+        A task routed to from several branches is only ready once every
+        branch that could still lead to it has resolved, so it runs once.
+        """
+        waiting = list(waiting)
+        blockers = set(waiting).union(running)
+        return [
+            task_name for task_name in waiting
+            if not any(
+                task_name in self._reachable.get(other, ())
+                for other in blockers
+                if other != task_name
+            )
+        ]
@@ -4,11 +4,16 @@ This module provides JWT token generation, password hashing,
 and user authentication functionality.
 """
 
+import hashlib
 import secrets
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
+import bcrypt
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 import logging
 
 from app.models.auth import User, UserInDB, TokenData, UserRole
@@ -16,7 +21,26 @@ from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+
+# Verified tokens keyed by a digest of the raw token -> (TokenData, exp).
+# Dependencies run in the threadpool, so access is guarded by a lock.
+_token_cache: TTLCache = TTLCache(
+    maxsize=settings.token_cache_maxsize,
+    ttl=settings.token_cache_ttl
+)
+_token_cache_lock = threading.Lock()
+
+_ROLE_LOOKUP: Dict[str, UserRole] = {role.value: role for role in UserRole}
+
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 fake_users_db: Dict[str, UserInDB] = {
     "admin": UserInDB(
@@ -24,7 +48,7 @@ fake_users_db: Dict[str, UserInDB] = {
         email="admin@flowmanager.com",
         full_name="System Administrator",
         role=UserRole.ADMIN,
-        hashed_password=pwd_context.hash("admin123"),
+        hashed_password=_hash_password("admin123"),
         disabled=False
     ),
     "user": UserInDB(
@@ -32,7 +56,7 @@ fake_users_db: Dict[str, UserInDB] = {
         email="user@flowmanager.com",
         full_name="Regular User",
         role=UserRole.USER,
-        hashed_password=pwd_context.hash("user123"),
+        hashed_password=_hash_password("user123"),
         disabled=False
     ),
     "viewer": UserInDB(
@@ -40,7 +64,7 @@ fake_users_db: Dict[str, UserInDB] = {
         email="viewer@flowmanager.com",
         full_name="Read Only User",
         role=UserRole.VIEWER,
-        hashed_password=pwd_context.hash("viewer123"),
+        hashed_password=_hash_password("viewer123"),
         disabled=False
     )
 }
@@ -49,24 +73,25 @@ fake_users_db: Dict[str, UserInDB] = {
 class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
     
     @staticmethod
     def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password)
+        return _hash_password(password)
     
     @staticmethod
     def get_user(username: str) -> Optional[UserInDB]:
-        if username in fake_users_db:
-            return fake_users_db[username]
-        return None
+        return fake_users_db.get(username)
     
     @staticmethod
-    def authenticate_user(username: str, password: str) -> Optional[UserInDB]:
+    async def authenticate_user(username: str, password: str) -> Optional[UserInDB]:
         user = AuthService.get_user(username)
         if not user:
             return None
-        if not AuthService.verify_password(password, user.hashed_password):
+        # bcrypt is deliberately slow; keep it off the event loop
+        if not await run_in_threadpool(
+            AuthService.verify_password, password, user.hashed_password
+        ):
             return None
         if user.disabled:
             return None
@@ -78,18 +103,13 @@ class AuthService:
         expires_delta: Optional[timedelta] = None
     ) -> str:
         to_encode = data.copy()
+        now = datetime.now(timezone.utc)
         
-        if expires_delta:
-            expire = datetime.now(timezone.utc) + expires_delta
-        else:
-            expire = datetime.now(timezone.utc) + timedelta(
-                minutes=settings.access_token_expire_minutes
-            )
-        
-        to_encode.update({
-            "exp": expire,
-            "iat": datetime.now(timezone.utc)
-        })
+        to_encode["iat"] = now
+        to_encode["exp"] = now + (
+            expires_delta
+            or timedelta(minutes=settings.access_token_expire_minutes)
+        )
         
         encoded_jwt = jwt.encode(
             to_encode,
@@ -101,28 +121,49 @@ class AuthService:
     
     @staticmethod
     def decode_token(token: str) -> Optional[TokenData]:
+        # Reject malformed or oversized tokens before any hashing/decoding
+        if (
+            not token
+            or len(token) > settings.max_token_length
+            or token.count(".") != 2
+        ):
+            return None
+        
+        cache_key = _token_cache_key(token)
+        
+        with _token_cache_lock:
+            cached: Optional[Tuple[TokenData, float]] = _token_cache.get(cache_key)
+            if cached is not None:
+                token_data, exp = cached
+                if exp > time.time():
+                    return token_data
+                # Token expired since it was cached; let jwt.decode reject it
+                del _token_cache[cache_key]
+        
         try:
+            # Missing or malformed sub/exp claims are rejected by the decoder
             payload = jwt.decode(
                 token,
                 settings.secret_key,
-                algorithms=[settings.algorithm]
+                algorithms=[settings.algorithm],
+                options={"require_exp": True, "require_sub": True}
             )
-            username: str = payload.get("sub")
-            role: str = payload.get("role")
             
-            if username is None:
-                return None
-            
-            return TokenData(
-                username=username,
-                role=UserRole(role) if role else None
+            token_data = TokenData(
+                username=payload["sub"],
+                role=_ROLE_LOOKUP.get(payload.get("role"))
             )
+            
+            with _token_cache_lock:
+                _token_cache[cache_key] = (token_data, payload["exp"])
+            
+            return token_data
         except JWTError as e:
-            logger.error(f"JWT decode error: {e}")
+            logger.error("JWT decode error: %s", e)
             return None
     
     @staticmethod
-    def create_user(
+    async def create_user(
         username: str,
         email: str,
         password: str,
@@ -137,24 +178,17 @@ class AuthService:
             email=email,
             full_name=full_name,
             role=role,
-            hashed_password=AuthService.get_password_hash(password),
+            hashed_password=await run_in_threadpool(
+                AuthService.get_password_hash, password
+            ),
             disabled=False
         )
         
         fake_users_db[username] = user
-        logger.info(f"Created new user: {username}")
+        logger.info("Created new user: %s", username)
         
         return user
     
     @staticmethod
     def has_permission(user: User, required_role: UserRole) -> bool:
-        role_hierarchy = {
-            UserRole.VIEWER: 1,
-            UserRole.USER: 2,
-            UserRole.ADMIN: 3
-        }
-        
-        user_level = role_hierarchy.get(user.role, 0)
-        required_level = role_hierarchy.get(required_role, 0)
-        
-        return user_level >= required_level
+        return user.role.level >= required_role.level
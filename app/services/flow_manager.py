@@ -1,14 +1,22 @@
 """Flow Manager - Core flow execution engine.
 
-This module implements the main flow execution logic, handling sequential
-task execution and conditional branching based on task outcomes.
+This module implements the main flow execution logic, scheduling tasks as
+their triggering conditions resolve and branching based on task outcomes.
 """
 
-import uuid
+import asyncio
 import logging
+import secrets
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
 from typing import Dict, Any, Optional
 
+from fastapi.concurrency import run_in_threadpool
+
 from app.models.flow import Flow
 from app.models.execution import (
     FlowExecutionState,
@@ -16,20 +24,40 @@ from app.models.execution import (
     ExecutionResult,
 )
 from app.services.task_registry import TaskRegistry
+from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _result_key(task_name: str) -> str:
+    """Context key under which a task's output data is stored."""
+    return sys.intern(f"{task_name}_result")
+
+
 class FlowManager:
-    def __init__(self):
-        self.execution_states: Dict[str, FlowExecutionState] = {}
+    def __init__(
+        self,
+        max_history: Optional[int] = None,
+        archive_dir: Optional[str] = None
+    ):
+        # LRU order: executions move to the end when they finish, and the
+        # least recently finished ones are evicted first
+        self.execution_states: "OrderedDict[str, FlowExecutionState]" = OrderedDict()
+        self.max_history = max_history or settings.max_execution_history
+        
+        archive_dir = archive_dir or settings.execution_archive_dir
+        self.archive_dir: Optional[Path] = Path(archive_dir) if archive_dir else None
+        if self.archive_dir is not None:
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
     
     async def execute_flow(
         self,
         flow: Flow,
         context: Optional[Dict[str, Any]] = None
     ) -> ExecutionResult:
-        execution_id = f"exec_{uuid.uuid4().hex[:12]}"
+        # 72 random bits in 12 URL-safe chars (the old hex[:12] carried 48)
+        execution_id = f"exec_{secrets.token_urlsafe(9)}"
         
         execution_state = FlowExecutionState(
             execution_id=execution_id,
@@ -40,10 +68,11 @@ class FlowManager:
         )
         
         self.execution_states[execution_id] = execution_state
+        await self._trim_history()
         
         logger.info(
-            f"Starting flow execution: {execution_id} "
-            f"for flow '{flow.name}' (ID: {flow.id})"
+            "Starting flow execution: %s for flow '%s' (ID: %s)",
+            execution_id, flow.name, flow.id
         )
         
         try:
@@ -55,8 +84,8 @@ class FlowManager:
             execution_state.completed_at = datetime.now(timezone.utc)
             
             logger.info(
-                f"Flow execution {execution_id} completed "
-                f"with status: {execution_state.status}"
+                "Flow execution %s completed with status: %s",
+                execution_id, execution_state.status
             )
             
             return ExecutionResult(
@@ -73,7 +102,7 @@ class FlowManager:
             execution_state.completed_at = datetime.now(timezone.utc)
             
             logger.error(
-                f"Flow execution {execution_id} failed: {e}",
+                "Flow execution %s failed: %s", execution_id, e,
                 exc_info=True
             )
             
@@ -84,6 +113,43 @@ class FlowManager:
                 message=f"Flow execution failed: {str(e)}",
                 execution_state=execution_state
             )
+        
+        finally:
+            # Running executions are never evicted, so this one is still here
+            self.execution_states.move_to_end(execution_id)
+            await self._trim_history()
+    
+    async def _trim_history(self):
+        # Running executions are skipped so their archived copy is never
+        # stale; history may briefly exceed max_history until they finish.
+        while len(self.execution_states) > self.max_history:
+            evicted = next(
+                (
+                    state for state in self.execution_states.values()
+                    if state.status != ExecutionStatus.RUNNING
+                ),
+                None
+            )
+            if evicted is None:
+                return
+            
+            # Archived before it leaves memory, so lookups never miss it
+            if self.archive_dir is not None:
+                path = self.archive_dir / f"{evicted.execution_id}.json"
+                try:
+                    await run_in_threadpool(
+                        path.write_text, evicted.model_dump_json()
+                    )
+                    logger.debug(
+                        "Archived execution %s to %s", evicted.execution_id, path
+                    )
+                except OSError as e:
+                    logger.error(
+                        "Failed to archive execution %s: %s",
+                        evicted.execution_id, e
+                    )
+            
+            self.execution_states.pop(evicted.execution_id, None)
     
     async def _run_flow(
         self,
@@ -91,56 +157,104 @@ class FlowManager:
         execution_state: FlowExecutionState,
         context: Dict[str, Any]
     ):
-        current_task_name = flow.start_task
+        # Reserve every result slot up front, in place so a caller's dict
+        # still receives the results; values it supplied are left alone.
+        for task in flow.tasks:
+            context.setdefault(_result_key(task.name), None)
+        
+        # Tasks a condition has routed to wait until every branch that could
+        # still route to them has resolved, so joins run once; independent
+        # branches fanned out from the same task run concurrently.
+        pending: Dict[str, asyncio.Task] = {}
+        waiting: Dict[str, None] = {}  # insertion-ordered set
         max_iterations = 100
         iteration_count = 0
         
-        while current_task_name != "end" and iteration_count < max_iterations:
-            iteration_count += 1
-            
-            task = flow.get_task(current_task_name)
-            if not task:
-                raise ValueError(f"Task '{current_task_name}' not found in flow")
+        def route(task_name: str):
+            if task_name == "end" or task_name in pending:
+                return
             
-            execution_state.current_task = current_task_name
-            
-            logger.info(f"Executing task: {current_task_name}")
-            
-            task_result = await TaskRegistry.execute_task(
-                current_task_name,
-                context
-            )
+            if not flow.get_task(task_name):
+                raise ValueError(f"Task '{task_name}' not found in flow")
             
-            execution_state.add_task_result(task_result)
-            
-            if task_result.data:
-                context[f"{current_task_name}_result"] = task_result.data
-            
-            condition = flow.get_condition_for_task(current_task_name)
+            waiting[task_name] = None
+        
+        def start(task_name: str):
+            nonlocal iteration_count
             
-            if not condition:
-                logger.info(
-                    f"No condition found for task '{current_task_name}'. "
-                    "Ending flow."
+            if iteration_count >= max_iterations:
+                raise RuntimeError(
+                    "Flow execution exceeded maximum iterations. "
+                    "Possible infinite loop detected."
                 )
-                break
+            iteration_count += 1
             
-            next_task = self._evaluate_condition(condition, task_result)
+            del waiting[task_name]
+            execution_state.current_task = task_name
+            logger.info("Executing task: %s", task_name)
             
-            logger.info(
-                f"Condition '{condition.name}' evaluated. "
-                f"Next task: {next_task}"
+            pending[task_name] = asyncio.create_task(
+                TaskRegistry.execute_task(task_name, context),
+                name=task_name
             )
-            
-            current_task_name = next_task
         
-        execution_state.current_task = None
+        def start_ready():
+            ready = flow.get_ready_tasks(waiting, pending)
+            
+            # With nothing running, waiting tasks can only block each other
+            # through a loop; start the one routed to first to break it
+            if not ready and not pending and waiting:
+                ready = [next(iter(waiting))]
+            
+            for task_name in ready:
+                start(task_name)
         
-        if iteration_count >= max_iterations:
-            raise RuntimeError(
-                "Flow execution exceeded maximum iterations. "
-                "Possible infinite loop detected."
-            )
+        try:
+            route(flow.start_task)
+            start_ready()
+            
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending.values(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                # The loop is single-threaded, so results are merged into the
+                # shared context here without locking.
+                for finished in done:
+                    task_name = finished.get_name()
+                    del pending[task_name]
+                    task_result = finished.result()
+                    
+                    execution_state.add_task_result(task_result)
+                    
+                    if task_result.data:
+                        context[_result_key(task_name)] = task_result.data
+                    
+                    conditions = flow.get_conditions_for_task(task_name)
+                    
+                    if not conditions:
+                        logger.info(
+                            "No condition found for task '%s'. Ending branch.",
+                            task_name
+                        )
+                        continue
+                    
+                    for condition in conditions:
+                        next_task = self._evaluate_condition(condition, task_result)
+                        
+                        logger.info(
+                            "Condition '%s' evaluated. Next task: %s",
+                            condition.name, next_task
+                        )
+                        
+                        route(next_task)
+                
+                start_ready()
+        finally:
+            for task in pending.values():
+                task.cancel()
+            execution_state.current_task = None
     
     def _evaluate_condition(
         self,
@@ -149,20 +263,23 @@ class FlowManager:
     ) -> str:
         task_status = task_result.status.value
         expected_outcome = condition.outcome
+        matched = task_status == expected_outcome
         
-        if task_status == expected_outcome:
-            next_task = condition.target_task_success
-            logger.debug(
-                f"Task '{task_result.task_name}' status '{task_status}' "
-                f"matches expected outcome '{expected_outcome}'. "
-                f"Proceeding to '{next_task}'"
-            )
-        else:
-            next_task = condition.target_task_failure
+        # Index with the comparison result instead of branching on it
+        next_task = (
+            condition.target_task_failure,
+            condition.target_task_success
+        )[matched]
+        
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(
-                f"Task '{task_result.task_name}' status '{task_status}' "
-                f"does not match expected outcome '{expected_outcome}'. "
-                f"Proceeding to '{next_task}'"
+                "Task '%s' status '%s' %s expected outcome '%s'. "
+                "Proceeding to '%s'",
+                task_result.task_name,
+                task_status,
+                "matches" if matched else "does not match",
+                expected_outcome,
+                next_task
             )
         
         return next_task
@@ -174,11 +291,7 @@ class FlowManager:
                 f"Executed {len(execution_state.task_results)} task(s)."
             )
         elif execution_state.status == ExecutionStatus.FAILURE:
-            failed_task = None
-            for result in execution_state.task_results:
-                if result.status == ExecutionStatus.FAILURE:
-                    failed_task = result.task_name
-                    break
+            failed_task = execution_state.first_failed_task
             
             if failed_task:
                 return (
@@ -190,8 +303,42 @@ class FlowManager:
         else:
             return f"Flow '{execution_state.flow_name}' status: {execution_state.status}"
     
-    def get_execution_state(self, execution_id: str) -> Optional[FlowExecutionState]:
-        return self.execution_states.get(execution_id)
+    async def get_execution_state(
+        self,
+        execution_id: str
+    ) -> Optional[FlowExecutionState]:
+        execution_state = self.execution_states.get(execution_id)
+        if execution_state is not None or self.archive_dir is None:
+            return execution_state
+        
+        # Only plain IDs map to archive files; anything else cannot exist there
+        if not execution_id.replace("_", "").replace("-", "").isalnum():
+            return None
+        
+        path = self.archive_dir / f"{execution_id}.json"
+        try:
+            data = await run_in_threadpool(path.read_text)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(
+                "Failed to read archived execution %s: %s", execution_id, e
+            )
+            return None
+        
+        # ValidationError is a ValueError; a truncated or corrupt file lands here
+        try:
+            return FlowExecutionState.model_validate_json(data)
+        except ValueError as e:
+            logger.error(
+                "Archived execution %s is unreadable: %s", execution_id, e
+            )
+            return None
     
-    def list_executions(self) -> list[FlowExecutionState]:
-        return list(self.execution_states.values())
+    def list_executions(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> list[FlowExecutionState]:
+        stop = offset + limit if limit is not None else None
+        return list(islice(self.execution_states.values(), offset, stop))
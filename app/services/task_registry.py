@@ -4,36 +4,94 @@ This module provides a registry pattern for task management, allowing
 dynamic task registration and execution.
 """
 
-from typing import Callable, Dict, Any
-from functools import wraps
+from datetime import datetime, timezone
+from typing import Callable, Dict, Any, Optional, Tuple
+import hashlib
 import logging
+import sys
+
+import orjson
+from cachetools import LRUCache
 
 from app.models.execution import TaskResult, ExecutionStatus
+from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
 _TASK_REGISTRY: Dict[str, Callable] = {}
 
+# Context keys read by tasks registered as pure; only these are memoized
+_PURE_TASK_INPUTS: Dict[str, Tuple[str, ...]] = {}
+
+# Successful results of pure tasks, keyed by input fingerprint
+_RESULT_CACHE: LRUCache = LRUCache(maxsize=settings.task_result_cache_size)
+
+
+def _set_purity(task_name: str, pure: bool, input_keys: Tuple[str, ...]):
+    if pure:
+        _PURE_TASK_INPUTS[task_name] = tuple(input_keys)
+    else:
+        _PURE_TASK_INPUTS.pop(task_name, None)
+
+
+def _fingerprint(
+    task_name: str,
+    input_keys: Tuple[str, ...],
+    context: Dict[str, Any]
+) -> str:
+    # No default= fallback: str() of a set or other unordered object is not
+    # stable, so inputs orjson cannot encode natively raise instead
+    inputs = orjson.dumps(
+        {key: context.get(key) for key in input_keys},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return hashlib.blake2b(
+        task_name.encode() + b"\0" + inputs,
+        digest_size=16
+    ).hexdigest()
+
 
-def register_task(task_name: str):
+def _mark_failed(result: TaskResult, error: str):
+    result.status = ExecutionStatus.FAILURE
+    result.error = error
+
+
+def register_task(
+    task_name: str,
+    pure: bool = False,
+    input_keys: Tuple[str, ...] = ()
+):
+    """Register a task function under ``task_name``.
+    
+    Tasks marked ``pure`` are deterministic functions of the context keys
+    listed in ``input_keys``; their successful results are memoized.
+    Inputs must be JSON-like (dicts, lists, strings, numbers, datetimes);
+    anything orjson cannot encode, such as a set, runs uncached.
+    """
+    # Interned so registry and context lookups compare by identity first
+    task_name = sys.intern(task_name)
+    
     def decorator(func: Callable):
         if task_name in _TASK_REGISTRY:
-            logger.warning(f"Task '{task_name}' already registered. Overwriting.")
+            logger.warning("Task '%s' already registered. Overwriting.", task_name)
         _TASK_REGISTRY[task_name] = func
-        
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            return await func(*args, **kwargs)
-        
-        return wrapper
+        _set_purity(task_name, pure, input_keys)
+        return func
     return decorator
 
 
 class TaskRegistry:
     @staticmethod
-    def register(task_name: str, task_func: Callable):
+    def register(
+        task_name: str,
+        task_func: Callable,
+        pure: bool = False,
+        input_keys: Tuple[str, ...] = ()
+    ):
+        task_name = sys.intern(task_name)
         _TASK_REGISTRY[task_name] = task_func
-        logger.info(f"Registered task: {task_name}")
+        _set_purity(task_name, pure, input_keys)
+        logger.info("Registered task: %s", task_name)
     
     @staticmethod
     def get_task(task_name: str) -> Callable:
@@ -50,20 +108,41 @@ class TaskRegistry:
         task_name: str,
         context: Dict[str, Any] = None
     ) -> TaskResult:
-        from datetime import datetime
-        
         if context is None:
             context = {}
         
-        result = TaskResult(
+        fingerprint: Optional[str] = None
+        input_keys = _PURE_TASK_INPUTS.get(task_name)
+        if input_keys is not None:
+            try:
+                fingerprint = _fingerprint(task_name, input_keys, context)
+            except (TypeError, orjson.JSONEncodeError) as e:
+                logger.warning(
+                    "Task '%s' inputs cannot be fingerprinted, running "
+                    "uncached: %s", task_name, e
+                )
+            cached = (
+                _RESULT_CACHE.get(fingerprint) if fingerprint is not None
+                else None
+            )
+            if cached is not None:
+                logger.info("Task '%s' served from result cache", task_name)
+                now = datetime.now(timezone.utc)
+                return cached.model_copy(
+                    deep=True,
+                    update={"started_at": now, "completed_at": now}
+                )
+        
+        # Fields come from trusted internal values, so skip validation
+        result = TaskResult.model_construct(
             task_name=task_name,
             status=ExecutionStatus.PENDING,
-            started_at=datetime.utcnow()
+            started_at=datetime.now(timezone.utc)
         )
         
         try:
             task_func = TaskRegistry.get_task(task_name)
-            logger.info(f"Executing task: {task_name}")
+            logger.info("Executing task: %s", task_name)
             
             task_output = await task_func(context=context)
             
@@ -79,33 +158,46 @@ class TaskRegistry:
                 result.data = data
                 result.error = error
             else:
-                result.status = ExecutionStatus.FAILURE
-                result.error = f"Invalid task output format: {type(task_output)}"
+                _mark_failed(
+                    result, f"Invalid task output format: {type(task_output)}"
+                )
             
-            result.completed_at = datetime.utcnow()
             logger.info(
-                f"Task '{task_name}' completed with status: {result.status}"
+                "Task '%s' completed with status: %s", task_name, result.status
             )
             
+            # Only successes are cached so transient failures are retried
+            if fingerprint is not None and result.is_successful():
+                _RESULT_CACHE[fingerprint] = result.model_copy(deep=True)
+            
         except KeyError as e:
-            result.status = ExecutionStatus.FAILURE
-            result.error = f"Task not found: {str(e)}"
-            result.completed_at = datetime.utcnow()
-            logger.error(f"Task '{task_name}' not found: {e}")
+            _mark_failed(result, f"Task not found: {str(e)}")
+            logger.error("Task '%s' not found: %s", task_name, e)
             
         except Exception as e:
-            result.status = ExecutionStatus.FAILURE
-            result.error = f"Task execution failed: {str(e)}"
-            result.completed_at = datetime.utcnow()
-            logger.error(f"Task '{task_name}' failed: {e}", exc_info=True)
+            _mark_failed(result, f"Task execution failed: {str(e)}")
+            logger.error("Task '%s' failed: %s", task_name, e, exc_info=True)
         
+        # One clock read per task, shared by every completion path
+        result.completed_at = datetime.now(timezone.utc)
         return result
     
     @staticmethod
     def list_tasks() -> list:
         return list(_TASK_REGISTRY.keys())
     
+    @staticmethod
+    def invalidate(fingerprint: str) -> bool:
+        return _RESULT_CACHE.pop(fingerprint, None) is not None
+    
+    @staticmethod
+    def clear_cache():
+        _RESULT_CACHE.clear()
+        logger.info("Task result cache cleared")
+    
     @staticmethod
     def clear():
         _TASK_REGISTRY.clear()
+        _PURE_TASK_INPUTS.clear()
+        _RESULT_CACHE.clear()
         logger.info("Task registry cleared")
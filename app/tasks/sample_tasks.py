@@ -9,19 +9,28 @@ with 'status', and optional 'data' or 'error' fields.
 import asyncio
 import logging
 import random
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 from app.services.task_registry import register_task
+from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+_PROCESSED_TIMESTAMP = "2025-10-28T10:00:00Z"
+
+
+async def _simulate_io(seconds: float):
+    """Stand in for real I/O latency unless disabled via SIMULATE_IO."""
+    if settings.simulate_io:
+        await asyncio.sleep(seconds)
+
 
 @register_task("task1")
 async def fetch_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Task 1: Fetching data...")
     
     # Simulate async I/O operation
-    await asyncio.sleep(0.5)
+    await _simulate_io(0.5)
     
     try:
         # Simulate data fetching
@@ -36,7 +45,9 @@ async def fetch_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
             "source": "external_api"
         }
         
-        logger.info(f"Task 1: Successfully fetched {fetched_data['total_count']} records")
+        logger.info(
+            "Task 1: Successfully fetched %d records", fetched_data['total_count']
+        )
         
         return {
             "status": "success",
@@ -44,18 +55,35 @@ async def fetch_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Task 1: Failed to fetch data: {e}")
+        logger.error("Task 1: Failed to fetch data: %s", e)
         return {
             "status": "failure",
             "error": str(e)
         }
 
 
-@register_task("task2")
+def _process_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Transform raw records into their processed form.
+    
+    Kept as a single comprehension so the per-record work stays in one
+    tight loop without repeated list.append lookups.
+    """
+    return [
+        {
+            "id": record["id"],
+            "value": record["value"].upper(),
+            "processed": True,
+            "timestamp": _PROCESSED_TIMESTAMP
+        }
+        for record in records
+    ]
+
+
+@register_task("task2", pure=True, input_keys=("task1_result",))
 async def process_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Task 2: Processing data...")
     
-    await asyncio.sleep(0.3)
+    await _simulate_io(0.3)
     
     try:
         task1_result = context.get("task1_result")
@@ -65,15 +93,7 @@ async def process_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
         
         records = task1_result.get("records", [])
         
-        processed_records = []
-        for record in records:
-            processed_record = {
-                "id": record["id"],
-                "value": record["value"].upper(),
-                "processed": True,
-                "timestamp": "2025-10-28T10:00:00Z"
-            }
-            processed_records.append(processed_record)
+        processed_records = _process_records(records)
         
         processed_data = {
             "processed_records": processed_records,
@@ -82,7 +102,7 @@ async def process_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
         }
         
         logger.info(
-            f"Task 2: Successfully processed {len(processed_records)} records"
+            "Task 2: Successfully processed %d records", len(processed_records)
         )
         
         return {
@@ -91,7 +111,7 @@ async def process_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Task 2: Failed to process data: {e}")
+        logger.error("Task 2: Failed to process data: %s", e)
         return {
             "status": "failure",
             "error": str(e)
@@ -103,7 +123,7 @@ async def store_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Task 3: Storing data...")
     
     # Simulate async storage operation
-    await asyncio.sleep(0.4)
+    await _simulate_io(0.4)
     
     try:
         task2_result = context.get("task2_result")
@@ -121,7 +141,7 @@ async def store_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
         }
         
         logger.info(
-            f"Task 3: Successfully stored {storage_result['stored_count']} records"
+            "Task 3: Successfully stored %d records", storage_result['stored_count']
         )
         
         return {
@@ -130,7 +150,7 @@ async def store_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Task 3: Failed to store data: {e}")
+        logger.error("Task 3: Failed to store data: %s", e)
         return {
             "status": "failure",
             "error": str(e)
@@ -141,9 +161,14 @@ async def store_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
 async def validate_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Validating data...")
     
-    await asyncio.sleep(0.2)
+    await _simulate_io(0.2)
     
-    is_valid = random.choice([True, True, True, False])
+    # Random failures exercise the failure branch; disable for reproducible runs
+    is_valid = (
+        random.choice([True, True, True, False])
+        if settings.simulate_validation_failures
+        else True
+    )
     
     if is_valid:
         return {
@@ -161,7 +186,7 @@ async def validate_data_task(context: Dict[str, Any]) -> Dict[str, Any]:
 async def send_notification_task(context: Dict[str, Any]) -> Dict[str, Any]:
     logger.info("Sending notification...")
     
-    await asyncio.sleep(0.1)
+    await _simulate_io(0.1)
     
     return {
         "status": "success",
@@ -0,0 +1,140 @@
+"""
+Regression tests for FlowManager task scheduling
+
+Drives FlowManager directly with stub tasks to check how joins, retry loops,
+the iteration guard and unknown targets are handled.
+Run with: python test_flow_scheduling.py
+"""
+
+import asyncio
+import os
+
+# Keep the sample tasks from sleeping when app.tasks is imported
+os.environ.setdefault("SIMULATE_IO", "False")
+
+from app.models.execution import ExecutionStatus
+from app.models.flow import Flow
+from app.services.flow_manager import FlowManager
+from app.services.task_registry import TaskRegistry
+
+
+def make_task(name, runs, delay=0.0, failures=0):
+    """Stub task that records each run and fails its first ``failures`` runs."""
+    async def task(context):
+        runs.append(name)
+        await asyncio.sleep(delay)
+        if runs.count(name) <= failures:
+            return {"status": "failure", "error": f"{name} failed"}
+        return {"status": "success", "data": {"task": name}}
+    return task
+
+
+def condition(source, on_success, on_failure="end"):
+    return {
+        "name": f"{source}_to_{on_success}",
+        "description": f"Route {source}",
+        "source_task": source,
+        "outcome": "success",
+        "target_task_success": on_success,
+        "target_task_failure": on_failure,
+    }
+
+
+def make_flow(start_task, task_names, conditions):
+    return Flow(
+        id=f"flow_{start_task}",
+        name=f"Flow starting at {start_task}",
+        start_task=start_task,
+        tasks=[
+            {"name": name, "description": f"Stub {name}"}
+            for name in task_names
+        ],
+        conditions=conditions,
+    )
+
+
+def run_flow(flow):
+    return asyncio.run(FlowManager().execute_flow(flow))
+
+
+def test_diamond_join_runs_once():
+    """A task reached from two concurrent branches runs exactly once."""
+    diamond = make_flow(
+        "A",
+        ["A", "B", "C", "D"],
+        [
+            condition("A", "B"),
+            condition("A", "C"),
+            condition("B", "D"),
+            condition("C", "D"),
+        ],
+    )
+
+    for delays in ({"B": 0.01, "C": 0.05}, {"B": 0.05, "C": 0.01}):
+        runs = []
+        for name in "ABCD":
+            TaskRegistry.register(
+                name, make_task(name, runs, delay=delays.get(name, 0.0))
+            )
+
+        result = run_flow(diamond)
+
+        assert result.status == ExecutionStatus.SUCCESS, result.message
+        assert runs.count("D") == 1, f"D ran {runs.count('D')} times: {runs}"
+        assert runs[-1] == "D", f"D started before both branches: {runs}"
+        print(f"✓ Diamond with delays {delays} ran {runs}")
+
+
+def test_failure_retry_loop():
+    """A failure routed back to the same task retries it."""
+    runs = []
+    TaskRegistry.register("retry", make_task("retry", runs, failures=2))
+
+    result = run_flow(
+        make_flow("retry", ["retry"], [condition("retry", "end", "retry")])
+    )
+
+    assert result.status == ExecutionStatus.SUCCESS, result.message
+    assert runs == ["retry"] * 3, runs
+    print(f"✓ Retry loop ran {len(runs)} times before succeeding")
+
+
+def test_iteration_guard():
+    """A task that never stops routing back to itself is cut off."""
+    runs = []
+    TaskRegistry.register("forever", make_task("forever", runs, failures=10**6))
+
+    result = run_flow(
+        make_flow("forever", ["forever"], [condition("forever", "end", "forever")])
+    )
+
+    assert result.status == ExecutionStatus.FAILURE
+    assert "maximum iterations" in result.message, result.message
+    assert len(runs) == 100, len(runs)
+    print(f"✓ Endless loop stopped after {len(runs)} runs")
+
+
+def test_unknown_target_task():
+    """A condition routing to a task missing from the flow fails it."""
+    runs = []
+    TaskRegistry.register("first", make_task("first", runs))
+
+    result = run_flow(
+        make_flow("first", ["first"], [condition("first", "missing")])
+    )
+
+    assert result.status == ExecutionStatus.FAILURE
+    assert "'missing' not found in flow" in result.message, result.message
+    assert runs == ["first"], runs
+    print("✓ Routing to an unknown task failed the flow")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Testing FlowManager scheduling")
+    print("=" * 60)
+    test_diamond_join_runs_once()
+    test_failure_retry_loop()
+    test_iteration_guard()
+    test_unknown_target_task()
+    print("\nAll scheduling checks passed")
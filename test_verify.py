@@ -0,0 +1,64 @@
+"""
+Regression test for verify.py
+
+Checks that every leaf module of a package whose __init__ fails to import is
+reported as a failure, even though the checks share one interpreter.
+Run with: python test_verify.py
+"""
+
+import os
+import sys
+import tempfile
+
+import verify
+
+
+BROKEN_PACKAGE = {
+    "brokenpkg/__init__.py": "",
+    "brokenpkg/main.py": "from brokenpkg.models.flow import Flow\n",
+    "brokenpkg/models/__init__.py": (
+        "from brokenpkg.models.flow import Flow\n"
+        "from brokenpkg.models.auth import DoesNotExist\n"
+    ),
+    "brokenpkg/models/flow.py": "Flow = object\n",
+    "brokenpkg/models/auth.py": "User = object\n",
+}
+
+
+def test_broken_package_fails_leaf_modules():
+    """Leaf modules under an unimportable package must not pass."""
+    print("=" * 60)
+    print("Testing verify.py against an unimportable package")
+    print("=" * 60)
+
+    leaves = ("brokenpkg.main", "brokenpkg.models.flow", "brokenpkg.models.auth")
+
+    with tempfile.TemporaryDirectory() as root:
+        for path, source in BROKEN_PACKAGE.items():
+            full_path = os.path.join(root, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            with open(full_path, "w") as f:
+                f.write(source)
+
+        sys.path.insert(0, root)
+        try:
+            lines = []
+            all_ok = verify._run_checks([(leaf,) for leaf in leaves], lines)
+        finally:
+            sys.path.remove(root)
+            for name in [m for m in sys.modules if m.startswith("brokenpkg")]:
+                del sys.modules[name]
+
+    for line in lines:
+        print(line)
+
+    assert not all_ok, "verify.py reported a broken package as importable"
+    for leaf, line in zip(leaves, lines):
+        assert line.startswith("❌"), f"{leaf} passed despite its broken package"
+        assert "DoesNotExist" in line, f"{leaf} did not report the real error"
+
+    print("\n✓ Every leaf module of the broken package was reported as failing")
+
+
+if __name__ == "__main__":
+    test_broken_package_fails_leaf_modules()